@@ -7,19 +7,93 @@ Integrated with all available MCP connectors and Case 1FDV-23-0001009 support
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-import requests
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+from prometheus_fastapi_instrumentator import Instrumentator
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+import glob
+import hashlib
+import httpx
 import json
+import logging
+import orjson
 import os
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 import uvicorn
 from datetime import datetime
 import asyncio
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Configuration from environment variables
+PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+CASE_ID = os.getenv("CASE_ID", "1FDV-23-0001009")
+PORT = int(os.getenv("PORT", 8080))
+NODE_ENV = os.getenv("NODE_ENV", "production")
+REDIS_URL = os.getenv("REDIS_URL")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
+log = logging.getLogger("bridge")
+# httpx logs every outbound request at INFO; keep MCP traffic off the log hot path
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Response timestamps at one-second granularity, formatted once per second
+_ts_cache = [0, ""]
+
+def _ts() -> str:
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.utcfromtimestamp(now).isoformat() + "Z"
+    return _ts_cache[1]
+
+# Shared async HTTP client - one connection pool for all MCP traffic
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep-alive pool; connect retries are handled (with backoff) in _post_json, not here
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    app.state.http = httpx.AsyncClient(
+        transport=transport,
+        base_url=MCP_SERVER_URL,
+        timeout=httpx.Timeout(30.0),
+        headers={
+            "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+            "Content-Type": "application/json",
+            "X-Case-ID": CASE_ID
+        }
+    )
+    # Shared Redis cache when configured, otherwise the in-process TTL cache is used
+    app.state.redis = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+    yield
+    await app.state.http.aclose()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Drop this worker's live gauge values from the shared metrics directory
+        multiprocess.mark_process_dead(os.getpid())
 
 app = FastAPI(
     title="Perplexity App Connector Bridge - Maximum Intelligence",
     version="2.0.0",
-    description="Full MCP connector suite for Case 1FDV-23-0001009 and maximum AI capability"
+    description="Full MCP connector suite for Case 1FDV-23-0001009 and maximum AI capability",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -30,11 +104,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configuration from environment variables
-PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
-CASE_ID = os.getenv("CASE_ID", "1FDV-23-0001009")
-PORT = int(os.getenv("PORT", 8080))
-NODE_ENV = os.getenv("NODE_ENV", "production")
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip responses except NDJSON streams, which GZipMiddleware would buffer instead of flushing per line"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=500, compresslevel=5)
+
+# Request metrics for every endpoint, served at /metrics (aggregated across workers
+# through PROMETHEUS_MULTIPROC_DIR when uvicorn runs more than one)
+# Metrics live on a registry owned by this module rather than the global default, since
+# `python app_connector_bridge.py` executes the module again under uvicorn (and as
+# __mp_main__ in spawned workers) and would otherwise register every metric twice
+METRICS_REGISTRY = CollectorRegistry()
+
+Instrumentator(registry=METRICS_REGISTRY).instrument(app).expose(app, endpoint="/metrics")
 
 # API Keys for MCP connectors
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -47,8 +135,220 @@ COURTLISTENER_API_KEY = os.getenv("COURTLISTENER_API_KEY")
 # MCP Server Configuration
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "https://perplexity-mcp-server-production.railway.app")
 
+# Prometheus metrics for cache, batching and breaker tuning
+UPSTREAM_LATENCY = Histogram("mcp_upstream_latency_seconds", "Latency of individual MCP server requests", registry=METRICS_REGISTRY)
+UPSTREAM_RETRIES = Counter("mcp_upstream_retries_total", "MCP requests retried after a failed connection attempt", registry=METRICS_REGISTRY)
+CACHE_HITS = Counter("mcp_cache_hits_total", "Cacheable tool calls served from cache", registry=METRICS_REGISTRY)
+CACHE_MISSES = Counter("mcp_cache_misses_total", "Cacheable tool calls not found in cache", registry=METRICS_REGISTRY)
+INFLIGHT_COALESCED = Counter("mcp_inflight_coalesced_total", "Tool calls that joined an identical in-flight call", registry=METRICS_REGISTRY)
+CONNECTOR_CALLS = Counter("mcp_connector_calls_total", "Tool calls dispatched per connector", ["connector"], registry=METRICS_REGISTRY)
+BREAKER_STATE = Gauge(
+    "breaker_state",
+    "Worst MCP circuit breaker state across workers (0 closed, 1 half-open trial in flight, 2 open)",
+    multiprocess_mode="livemax",
+    registry=METRICS_REGISTRY
+)
+BATCH_SIZE = Histogram("mcp_batch_size", "Items per batch request", buckets=(1, 2, 4, 8, 16, 32, 64, 128), registry=METRICS_REGISTRY)
+TOOLS_AVAILABLE = Gauge("bridge_tools_total", "Tools exposed across all connectors", multiprocess_mode="livemax", registry=METRICS_REGISTRY)
+
+# Cap on concurrent upstream MCP calls per worker
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", 32))
+upstream_semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the MCP server while the breaker is open"""
+
+class MethodNotSupportedError(Exception):
+    """Raised when the MCP server rejects a probed method (e.g. tools/call_batch) as unsupported;
+    the server is healthy, so this is not counted against the circuit breaker"""
+
+# Statuses meaning "this server has no such method" for probed requests
+UNSUPPORTED_METHOD_STATUSES = frozenset({404, 405, 501})
+
+class CircuitBreaker:
+    """Opens after fail_max consecutive upstream failures and fails fast for reset_timeout seconds,
+    then lets a single trial call through before closing again"""
+    
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+    
+    @asynccontextmanager
+    async def call(self):
+        """Guard one upstream call, recording its outcome"""
+        state = self.state
+        if state == "open" or (state == "half_open" and self.trial_in_flight):
+            raise CircuitOpenError("MCP upstream unavailable")
+        
+        trial = state == "half_open"
+        if trial:
+            self.trial_in_flight = True
+            BREAKER_STATE.set(1)
+        try:
+            yield
+        except Exception as exc:
+            if isinstance(exc, httpx.TransportError) or (
+                isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+            ):
+                self.failures += 1
+                # A failed half-open trial re-opens immediately
+                if self.failures >= self.fail_max or self.opened_at is not None:
+                    if self.state != "open":
+                        self.times_opened += 1
+                    self.opened_at = time.monotonic()
+                    BREAKER_STATE.set(2)
+            raise
+        else:
+            self.failures = 0
+            if self.opened_at is not None:
+                self.opened_at = None
+                BREAKER_STATE.set(0)
+        finally:
+            if trial:
+                self.trial_in_flight = False
+
+breaker = CircuitBreaker(
+    fail_max=int(os.getenv("MCP_BREAKER_FAIL_MAX", 5)),
+    reset_timeout=float(os.getenv("MCP_BREAKER_RESET_TIMEOUT", 15))
+)
+upstream_stats = {"retries": 0}
+BREAKER_STATE.set(0)
+
+def _count_retry(retry_state):
+    upstream_stats["retries"] += 1
+    UPSTREAM_RETRIES.inc()
+
+async def _post_json(
+    path: str,
+    payload: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    probe: bool = False
+) -> Any:
+    """POST to a path on the MCP server via the shared client, bounded by the upstream semaphore.
+    With probe=True an unsupported-method status raises MethodNotSupportedError instead of
+    HTTPStatusError, keeping it out of the breaker's failure count"""
+    try:
+        body = orjson.dumps(payload)
+    except orjson.JSONEncodeError:
+        # Stdlib json accepts values orjson rejects, such as integers beyond 64 bits
+        body = json.dumps(payload).encode()
+    
+    async with breaker.call():
+        # Only retry failures where the request never reached the server - read/protocol
+        # errors may follow a processed write (page, issue, PR creation) and are not retried
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential_jitter(initial=0.1, max=2),
+            retry=retry_if_exception_type((httpx.ConnectError, httpx.PoolTimeout)),
+            before_sleep=_count_retry,
+            reraise=True
+        ):
+            with attempt:
+                # orjson encodes/decodes the body directly as bytes
+                async with upstream_semaphore:
+                    with UPSTREAM_LATENCY.time():
+                        response = await app.state.http.post(path, content=body, headers=headers)
+                if probe and response.status_code in UNSUPPORTED_METHOD_STATUSES:
+                    raise MethodNotSupportedError(f"MCP server does not support {payload['method']}")
+                response.raise_for_status()
+                return orjson.loads(response.content)
+
+# Response cache for idempotent read-style MCP tools
+CACHE_TTL = int(os.getenv("MCP_CACHE_TTL", 300))
+CACHEABLE_TOOLS = frozenset({
+    "search_web",
+    "search_memory",
+    "legal_research_courtlistener",
+    "case_law_search",
+    "finance_ticker_lookup",
+    "finance_price_history",
+    "finance_company_financials",
+    "finance_screener"
+})
+_local_cache = TTLCache(maxsize=1024, ttl=CACHE_TTL)
+
+def _cache_key(tool: str, arguments: Dict[str, Any], context: Dict[str, Any]) -> str:
+    """Stable cache key for a tool call, independent of argument ordering"""
+    data = orjson.dumps({"t": tool, "a": arguments, "c": context}, option=orjson.OPT_SORT_KEYS)
+    return "mcp:" + hashlib.blake2b(data).hexdigest()
+
+async def _cache_get(key: str) -> Any:
+    """Return a cached tool result, or None on a miss (cache errors count as misses)"""
+    if app.state.redis is None:
+        cached = _local_cache.get(key)
+    else:
+        try:
+            cached = await app.state.redis.get(key)
+        except RedisError:
+            CACHE_MISSES.inc()
+            return None
+    if not cached:
+        CACHE_MISSES.inc()
+        return None
+    CACHE_HITS.inc()
+    return orjson.loads(cached)
+
+async def _cache_set(key: str, result: Any):
+    """Store a tool result for CACHE_TTL seconds"""
+    data = orjson.dumps(result)
+    if app.state.redis is None:
+        _local_cache[key] = data
+    else:
+        try:
+            await app.state.redis.setex(key, CACHE_TTL, data)
+        except RedisError:
+            pass
+
+# In-flight cacheable calls - identical concurrent requests share one upstream round trip
+_inflight: Dict[str, asyncio.Task] = {}
+
+def _is_error_result(result: Any) -> bool:
+    """True for JSON-RPC error envelopes and MCP tool results flagged isError"""
+    if not isinstance(result, dict):
+        return False
+    if "error" in result or result.get("isError"):
+        return True
+    inner = result.get("result")
+    return isinstance(inner, dict) and bool(inner.get("isError"))
+
+async def _fetch_cached(key: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Any:
+    """Serve a cacheable tool call from cache, falling back to the MCP server"""
+    result = await _cache_get(key)
+    if result is None:
+        result = await _post_json("/mcp", payload, headers)
+        # Transient upstream errors must not be replayed from cache for CACHE_TTL
+        if not _is_error_result(result):
+            await _cache_set(key, result)
+    return result
+
+async def _single_flight(key: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Any:
+    """Join an identical in-flight call if there is one, otherwise start it"""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_cached(key, payload, headers))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        INFLIGHT_COALESCED.inc()
+    # Shielded so one caller disconnecting does not cancel the call for the others
+    return await asyncio.shield(task)
+
 # Request/Response Models
 class ToolRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     tool: str
     arguments: Dict[str, Any] = {}
     context: Dict[str, Any] = {}
@@ -179,222 +479,373 @@ CONNECTORS = {
     }
 }
 
+# Precomputed connector metadata - CONNECTORS never changes at runtime
+for connector in CONNECTORS.values():
+    connector["tools_set"] = frozenset(connector["tools"])
+    connector["tools_count"] = len(connector["tools"])
+
+TOTAL_TOOLS = sum(connector["tools_count"] for connector in CONNECTORS.values())
+_CASE_SPECIFIC_TOOL_COUNT = sum(
+    connector["tools_count"] for connector in CONNECTORS.values() if connector.get("case_specific")
+)
+TOOLS_AVAILABLE.set(TOTAL_TOOLS)
+
+# Per-connector request headers on top of the client defaults (auth, content type, case id)
+_CONNECTOR_HEADERS = {connector_id: {"X-Connector-ID": connector_id} for connector_id in CONNECTORS}
+
+CONNECTOR_SUMMARY = {}
+for connector_id, connector in CONNECTORS.items():
+    CONNECTOR_SUMMARY[connector_id] = {
+        "name": connector["name"],
+        "description": connector["description"],
+        "tools_count": connector["tools_count"],
+        "category": connector["category"],
+        "priority": connector["priority"],
+        "available": True
+    }
+    
+    if connector.get("case_specific"):
+        CONNECTOR_SUMMARY[connector_id]["case_id"] = CASE_ID
+
+# Static response payloads - built once, only timestamps are refreshed per request
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "service": "perplexity-app-connector-bridge-maximum",
+    "version": "2.0.0",
+    "connectors_available": len(CONNECTORS),
+    "total_tools": TOTAL_TOOLS,
+    "case_id": CASE_ID,
+    "environment": NODE_ENV
+}
+
+_CONNECTORS_PAYLOAD = {
+    "connectors": CONNECTOR_SUMMARY,
+    "total_connectors": len(CONNECTORS),
+    "total_tools": TOTAL_TOOLS,
+    "case_id": CASE_ID,
+    "status": "all_systems_operational"
+}
+
+_CONNECTOR_DETAILS = {
+    connector_id: {
+        "connector_id": connector_id,
+        "name": connector["name"],
+        "description": connector["description"],
+        "tools": connector["tools"],
+        "category": connector["category"],
+        "priority": connector["priority"],
+        "tools_count": connector["tools_count"],
+        "case_specific": connector.get("case_specific", False)
+    }
+    for connector_id, connector in CONNECTORS.items()
+}
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     return {
-        "status": "healthy",
-        "service": "perplexity-app-connector-bridge-maximum",
-        "version": "2.0.0",
-        "connectors_available": len(CONNECTORS),
-        "total_tools": sum(len(connector["tools"]) for connector in CONNECTORS.values()),
-        "case_id": CASE_ID,
-        "environment": NODE_ENV,
-        "timestamp": datetime.utcnow().isoformat()
+        **_HEALTH_STATIC,
+        "mcp_upstream": {
+            "breaker_state": breaker.state,
+            "breaker_times_opened": breaker.times_opened,
+            "retries": upstream_stats["retries"]
+        },
+        "timestamp": _ts()
     }
 
 # List all available connectors
 @app.get("/connectors")
 async def list_connectors():
-    connector_summary = {}
-    total_tools = 0
-    
-    for connector_id, connector in CONNECTORS.items():
-        tools_count = len(connector["tools"])
-        total_tools += tools_count
-        
-        connector_summary[connector_id] = {
-            "name": connector["name"],
-            "description": connector["description"],
-            "tools_count": tools_count,
-            "category": connector["category"],
-            "priority": connector["priority"],
-            "available": True
-        }
-        
-        if connector.get("case_specific"):
-            connector_summary[connector_id]["case_id"] = CASE_ID
-    
-    return {
-        "connectors": connector_summary,
-        "total_connectors": len(CONNECTORS),
-        "total_tools": total_tools,
-        "case_id": CASE_ID,
-        "status": "all_systems_operational"
-    }
+    return _CONNECTORS_PAYLOAD
 
 # Get specific connector details
 @app.get("/connectors/{connector_id}")
 async def get_connector_details(connector_id: str):
-    if connector_id not in CONNECTORS:
+    if connector_id not in _CONNECTOR_DETAILS:
         raise HTTPException(status_code=404, detail="Connector not found")
     
-    connector = CONNECTORS[connector_id]
-    
-    return {
-        "connector_id": connector_id,
-        "name": connector["name"],
-        "description": connector["description"],
-        "tools": connector["tools"],
-        "category": connector["category"],
-        "priority": connector["priority"],
-        "tools_count": len(connector["tools"]),
-        "case_specific": connector.get("case_specific", False)
-    }
+    return _CONNECTOR_DETAILS[connector_id]
 
-# Execute connector tool
-@app.post("/connectors/{connector_id}/execute")
-async def execute_connector_tool(connector_id: str, request: ToolRequest):
+def _validate_tool(connector_id: str, request: ToolRequest):
+    """Raise 404/400 unless the connector exists and exposes the requested tool"""
     if connector_id not in CONNECTORS:
         raise HTTPException(status_code=404, detail="Connector not found")
     
-    connector = CONNECTORS[connector_id]
-    
-    if request.tool not in connector["tools"]:
+    if request.tool not in CONNECTORS[connector_id]["tools_set"]:
         raise HTTPException(
             status_code=400, 
             detail=f"Tool {request.tool} not available in connector {connector_id}"
         )
-    
-    # Enhanced context for case-specific operations
-    enhanced_context = {
-        **request.arguments,
-        **request.context,
-        "case_id": CASE_ID,
-        "connector_id": connector_id,
-        "timestamp": datetime.utcnow().isoformat(),
-        "user_context": "Casey Del Carpio Barton - Case 1FDV-23-0001009"
-    }
+
+_BASE_CONTEXT = {
+    "case_id": CASE_ID,
+    "user_context": "Casey Del Carpio Barton - Case 1FDV-23-0001009"
+}
+
+def _tool_arguments(connector_id: str, request: ToolRequest) -> Dict[str, Any]:
+    """Enhanced context for case-specific operations (bridge keys override caller-supplied ones)"""
+    arguments = request.arguments | request.context
+    arguments.update(_BASE_CONTEXT)
+    arguments["connector_id"] = connector_id
+    arguments["timestamp"] = _ts()
+    return arguments
+
+def _upstream_error(e: Exception) -> HTTPException:
+    """Map a failed MCP call onto the HTTP error returned to the client"""
+    if isinstance(e, CircuitOpenError):
+        return HTTPException(status_code=503, detail="MCP upstream unavailable")
+    if isinstance(e, httpx.TimeoutException):
+        return HTTPException(status_code=504, detail="Tool execution timeout")
+    if isinstance(e, httpx.HTTPError):
+        return HTTPException(status_code=502, detail=f"MCP server error: {str(e)}")
+    if isinstance(e, json.JSONDecodeError):
+        # orjson.JSONDecodeError subclasses it - the MCP server replied with a non-JSON body
+        return HTTPException(status_code=502, detail=f"MCP server error: invalid JSON response: {str(e)}")
+    return HTTPException(status_code=500, detail=f"Execution error: {str(e)}")
+
+# Execute connector tool
+@app.post("/connectors/{connector_id}/execute")
+async def execute_connector_tool(connector_id: str, request: ToolRequest):
+    _validate_tool(connector_id, request)
+    CONNECTOR_CALLS.labels(connector=connector_id).inc()
     
     # MCP tool execution payload
     payload = {
         "method": "tools/call",
         "params": {
             "name": request.tool,
-            "arguments": enhanced_context
+            "arguments": _tool_arguments(connector_id, request)
         }
     }
     
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "X-Case-ID": CASE_ID,
-        "X-Connector-ID": connector_id
-    }
+    headers = _CONNECTOR_HEADERS[connector_id]
+    
+    cache_key = None
+    if request.tool in CACHEABLE_TOOLS:
+        try:
+            cache_key = _cache_key(request.tool, request.arguments, request.context)
+        except orjson.JSONEncodeError:
+            # Not representable by orjson (e.g. integers beyond 64 bits) - run uncached
+            cache_key = None
     
     try:
-        # Execute MCP tool with timeout and retry logic
-        async with asyncio.timeout(45):
-            response = requests.post(
-                f"{MCP_SERVER_URL}/mcp", 
-                json=payload, 
-                headers=headers, 
-                timeout=30
-            )
-            response.raise_for_status()
-            result = response.json()
-        
-        return ConnectorResponse(
-            status="success",
-            tool=request.tool,
-            result=result,
-            timestamp=datetime.utcnow().isoformat(),
-            connector=connector_id
-        )
-        
-    except asyncio.TimeoutError:
-        raise HTTPException(status_code=504, detail="Tool execution timeout")
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"MCP server error: {str(e)}")
+        if cache_key:
+            result = await _single_flight(cache_key, payload, headers)
+        else:
+            # Execute MCP tool on the shared client (timeout handled by httpx)
+            result = await _post_json("/mcp", payload, headers)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Execution error: {str(e)}")
+        raise _upstream_error(e)
+    
+    return ConnectorResponse(
+        status="success",
+        tool=request.tool,
+        result=result,
+        timestamp=_ts(),
+        connector=connector_id
+    )
 
 # Mobile dashboard for Perplexity app
+_DASHBOARD_STATIC = {
+    "case_overview": {
+        "case_id": CASE_ID,
+        "case_name": "Casey vs Teresa - Custody & Visitation",
+        "status": "Active - Trial Preparation",
+        "next_hearing": "2025-11-08", 
+        "exhibits_ready": 12,
+        "kekoa_status": "Healing from broken arm - needs father connection",
+        "priority_actions": [
+            "Schedule earlier visitation (before Nov 8)",
+            "Document Kekoa's care conditions", 
+            "Prepare November birthday celebration evidence",
+            "Continue building neglect documentation"
+        ]
+    },
+    "connector_status": {
+        "online": len(CONNECTORS),
+        "total": len(CONNECTORS),
+        "critical_systems": ["legal_research", "case_management", "search_intelligence"]
+    },
+    "quick_actions": [
+        {
+            "name": "🔍 Legal Research", 
+            "connector": "legal_research", 
+            "tool": "hawaii_family_court_research",
+            "description": "Research Hawaii family court precedents"
+        },
+        {
+            "name": "📝 Case Documentation", 
+            "connector": "notion_suite", 
+            "tool": "mcp_tool_notion-create-pages",
+            "description": "Document new evidence or timeline entries"
+        },
+        {
+            "name": "🔍 Search All Systems", 
+            "connector": "search_intelligence", 
+            "tool": "search_memory",
+            "description": "Search across all available information"
+        },
+        {
+            "name": "⚖️ Evidence Catalog", 
+            "connector": "case_management", 
+            "tool": "evidence_cataloger",
+            "description": "Organize and catalog case evidence"
+        },
+        {
+            "name": "📊 Generate Reports", 
+            "connector": "productivity_suite", 
+            "tool": "create_pdf",
+            "description": "Create professional case reports"
+        }
+    ],
+    "intelligence_summary": {
+        "total_tools_available": TOTAL_TOOLS,
+        "high_priority_connectors": 4,
+        "case_specific_tools": 6,
+        "maximum_capability": True
+    }
+}
+
 @app.get("/mobile/dashboard")
 async def mobile_dashboard():
     return {
-        "case_overview": {
-            "case_id": CASE_ID,
-            "case_name": "Casey vs Teresa - Custody & Visitation",
-            "status": "Active - Trial Preparation",
-            "next_hearing": "2025-11-08", 
-            "exhibits_ready": 12,
-            "kekoa_status": "Healing from broken arm - needs father connection",
-            "priority_actions": [
-                "Schedule earlier visitation (before Nov 8)",
-                "Document Kekoa's care conditions", 
-                "Prepare November birthday celebration evidence",
-                "Continue building neglect documentation"
-            ]
-        },
+        **_DASHBOARD_STATIC,
         "connector_status": {
-            "online": len(CONNECTORS),
-            "total": len(CONNECTORS),
-            "critical_systems": ["legal_research", "case_management", "search_intelligence"],
-            "last_health_check": datetime.utcnow().isoformat()
-        },
-        "quick_actions": [
-            {
-                "name": "🔍 Legal Research", 
-                "connector": "legal_research", 
-                "tool": "hawaii_family_court_research",
-                "description": "Research Hawaii family court precedents"
-            },
-            {
-                "name": "📝 Case Documentation", 
-                "connector": "notion_suite", 
-                "tool": "mcp_tool_notion-create-pages",
-                "description": "Document new evidence or timeline entries"
-            },
-            {
-                "name": "🔍 Search All Systems", 
-                "connector": "search_intelligence", 
-                "tool": "search_memory",
-                "description": "Search across all available information"
-            },
-            {
-                "name": "⚖️ Evidence Catalog", 
-                "connector": "case_management", 
-                "tool": "evidence_cataloger",
-                "description": "Organize and catalog case evidence"
-            },
-            {
-                "name": "📊 Generate Reports", 
-                "connector": "productivity_suite", 
-                "tool": "create_pdf",
-                "description": "Create professional case reports"
-            }
-        ],
-        "intelligence_summary": {
-            "total_tools_available": sum(len(connector["tools"]) for connector in CONNECTORS.values()),
-            "high_priority_connectors": 4,
-            "case_specific_tools": 6,
-            "maximum_capability": True
+            **_DASHBOARD_STATIC["connector_status"],
+            "last_health_check": _ts()
         }
     }
 
 # Batch execute multiple tools
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 16))
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", 32))
+
+# Flipped off the first time the MCP server rejects tools/call_batch
+_upstream_batch_supported = True
+
+async def _execute_per_call(items: List[tuple], settled: List[Any]):
+    """Run batch items as individual tool calls, at most BATCH_CONCURRENCY at a time"""
+    batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def run(connector_id: str, tool_request: ToolRequest):
+        async with batch_semaphore:
+            return await execute_connector_tool(connector_id, tool_request)
+    
+    outcomes = await asyncio.gather(
+        *(run(connector_id, tool_request) for _, connector_id, tool_request in items),
+        return_exceptions=True
+    )
+    for (index, _, _), outcome in zip(items, outcomes):
+        settled[index] = outcome
+
+async def _execute_upstream_batch(chunk: List[tuple], settled: List[Any]):
+    """Send a chunk of batch items to the MCP server as one tools/call_batch request"""
+    global _upstream_batch_supported
+    
+    payload = {
+        "method": "tools/call_batch",
+        "params": {
+            "calls": [
+                {"name": tool_request.tool, "arguments": _tool_arguments(connector_id, tool_request)}
+                for _, connector_id, tool_request in chunk
+            ]
+        }
+    }
+    
+    try:
+        result = await _post_json("/mcp", payload, probe=True)
+    except MethodNotSupportedError:
+        result = None
+    except Exception as e:
+        for index, _, _ in chunk:
+            settled[index] = _upstream_error(e)
+        return
+    
+    # JSON-RPC "method not found" is the other clear unsupported signal
+    error = result.get("error") if isinstance(result, dict) else None
+    if result is None or (isinstance(error, dict) and error.get("code") == -32601):
+        # Method not supported - remember it and serve this chunk call by call
+        _upstream_batch_supported = False
+        await _execute_per_call(chunk, settled)
+        return
+    
+    results = result.get("results") if isinstance(result, dict) else None
+    if not isinstance(results, list) or len(results) != len(chunk):
+        # The server may already have run these calls, so fail the chunk rather than replay it
+        for index, _, _ in chunk:
+            settled[index] = HTTPException(
+                status_code=502,
+                detail="MCP server error: malformed tools/call_batch response"
+            )
+        return
+    
+    timestamp = _ts()
+    for (index, connector_id, tool_request), item in zip(chunk, results):
+        CONNECTOR_CALLS.labels(connector=connector_id).inc()
+        settled[index] = ConnectorResponse(
+            status="success",
+            tool=tool_request.tool,
+            result=item,
+            timestamp=timestamp,
+            connector=connector_id
+        )
+
+def _batch_entry(connector_id: str, outcome: Any) -> Dict[str, Any]:
+    """Per-item batch result, classified by whether the item raised"""
+    if isinstance(outcome, HTTPException):
+        # str() of a keyword-built HTTPException is empty - surface its detail and status
+        return {
+            "connector_id": connector_id,
+            "status": "error",
+            "error": outcome.detail,
+            "status_code": outcome.status_code
+        }
+    if isinstance(outcome, Exception):
+        return {
+            "connector_id": connector_id,
+            "status": "error",
+            "error": str(outcome)
+        }
+    return {
+        "connector_id": connector_id,
+        "status": "success",
+        "result": outcome
+    }
+
 @app.post("/connectors/batch")
 async def batch_execute(requests: List[Dict[str, Any]]):
-    results = []
+    BATCH_SIZE.observe(len(requests))
+    settled: List[Any] = [None] * len(requests)
+    per_call = []
+    batchable = []
     
-    for req in requests:
+    for index, req in enumerate(requests):
         connector_id = req.get("connector_id")
-        tool_request = ToolRequest(**req.get("request", {}))
-        
         try:
-            result = await execute_connector_tool(connector_id, tool_request)
-            results.append({
-                "connector_id": connector_id,
-                "status": "success",
-                "result": result
-            })
+            tool_request = ToolRequest.model_validate(req.get("request", {}))
+            _validate_tool(connector_id, tool_request)
         except Exception as e:
-            results.append({
-                "connector_id": connector_id,
-                "status": "error",
-                "error": str(e)
-            })
+            settled[index] = e
+            continue
+        
+        # Cacheable tools keep the per-call path so they hit the cache and in-flight map
+        if tool_request.tool in CACHEABLE_TOOLS or not _upstream_batch_supported:
+            per_call.append((index, connector_id, tool_request))
+        else:
+            batchable.append((index, connector_id, tool_request))
+    
+    chunks = [batchable[i:i + BATCH_MAX_SIZE] for i in range(0, len(batchable), BATCH_MAX_SIZE)]
+    if len(batchable) == 1:
+        per_call.extend(batchable)
+        chunks = []
+    
+    # Dispatch everything concurrently so batch latency tracks the slowest call
+    await asyncio.gather(
+        _execute_per_call(per_call, settled),
+        *(_execute_upstream_batch(chunk, settled) for chunk in chunks)
+    )
+    
+    results = [_batch_entry(req.get("connector_id"), result) for req, result in zip(requests, settled)]
     
     return {
         "batch_results": results,
@@ -403,6 +854,35 @@ async def batch_execute(requests: List[Dict[str, Any]]):
         "failed": len([r for r in results if r["status"] == "error"])
     }
 
+# Streaming batch - one NDJSON line per item, in completion order
+@app.post("/connectors/batch/stream")
+async def batch_execute_stream(requests: List[Dict[str, Any]]):
+    BATCH_SIZE.observe(len(requests))
+    batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def run(index: int, req: Dict[str, Any]) -> Dict[str, Any]:
+        connector_id = req.get("connector_id")
+        try:
+            tool_request = ToolRequest.model_validate(req.get("request", {}))
+            async with batch_semaphore:
+                response = await execute_connector_tool(connector_id, tool_request)
+            outcome = response.model_dump()
+        except Exception as e:
+            outcome = e
+        return {"index": index, **_batch_entry(connector_id, outcome)}
+    
+    async def stream():
+        tasks = [asyncio.ensure_future(run(index, req)) for index, req in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield orjson.dumps(await next_done) + b"\n"
+        finally:
+            # Client went away - stop any calls still running
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 # Case-specific endpoint for 1FDV-23-0001009
 @app.get("/case/{case_id}/status")
 async def get_case_status(case_id: str):
@@ -427,36 +907,58 @@ async def get_case_status(case_id: str):
             "Prepare for shared November birthdays",
             "Ensure Kekoa's emotional and physical wellbeing"
         ],
-        "available_tools": len([tool for connector in CONNECTORS.values() if connector.get("case_specific") for tool in connector["tools"]]),
+        "available_tools": _CASE_SPECIFIC_TOOL_COUNT,
         "intelligence_status": "Maximum capability deployed"
     }
 
 # Root endpoint
+_ROOT_PAYLOAD = {
+    "service": "Perplexity App Connector Bridge - Maximum Intelligence",
+    "version": "2.0.0",
+    "description": "Complete MCP connector suite for maximum AI capability",
+    "case_id": CASE_ID,
+    "connectors_available": len(CONNECTORS),
+    "total_tools": TOTAL_TOOLS,
+    "endpoints": {
+        "health": "/health",
+        "connectors": "/connectors", 
+        "mobile_dashboard": "/mobile/dashboard",
+        "case_status": f"/case/{CASE_ID}/status",
+        "metrics": "/metrics"
+    },
+    "status": "ready_for_maximum_intelligence",
+    "message": "All systems operational. Case 1FDV-23-0001009 support active."
+}
+
 @app.get("/")
 async def root():
-    return {
-        "service": "Perplexity App Connector Bridge - Maximum Intelligence",
-        "version": "2.0.0",
-        "description": "Complete MCP connector suite for maximum AI capability",
-        "case_id": CASE_ID,
-        "connectors_available": len(CONNECTORS),
-        "total_tools": sum(len(connector["tools"]) for connector in CONNECTORS.values()),
-        "endpoints": {
-            "health": "/health",
-            "connectors": "/connectors", 
-            "mobile_dashboard": "/mobile/dashboard",
-            "case_status": f"/case/{CASE_ID}/status"
-        },
-        "status": "ready_for_maximum_intelligence",
-        "message": "All systems operational. Case 1FDV-23-0001009 support active."
-    }
+    return _ROOT_PAYLOAD
 
 if __name__ == "__main__":
-    print(f"🚀 Starting Perplexity App Connector Bridge - Maximum Intelligence")
-    print(f"📁 Case ID: {CASE_ID}")
-    print(f"🔧 Environment: {NODE_ENV}")
-    print(f"⚡ Connectors: {len(CONNECTORS)}")
-    print(f"🛠️ Total Tools: {sum(len(connector['tools']) for connector in CONNECTORS.values())}")
-    print(f"🌐 Port: {PORT}")
-    
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
\ No newline at end of file
+    log.info(
+        "bridge start case=%s env=%s connectors=%d tools=%d port=%d",
+        CASE_ID, NODE_ENV, len(CONNECTORS), TOTAL_TOOLS, PORT
+    )
+    
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+    if workers > 1:
+        # Each worker has its own metric values; share them through a multiprocess directory
+        # so /metrics reports totals whichever worker serves the scrape. Workers are spawned
+        # fresh, so they pick this up before importing prometheus_client.
+        metrics_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/bridge-prometheus")
+        os.makedirs(metrics_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(metrics_dir, "*.db")):
+            os.remove(stale)
+    
+    # Multiple workers need an import string; pools and caches are created per worker in lifespan.
+    # log_config=None leaves uvicorn's loggers on the root handler configured above
+    uvicorn.run(
+        "app_connector_bridge:app",
+        host="0.0.0.0",
+        port=PORT,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level=LOG_LEVEL.lower(),
+        log_config=None
+    )
\ No newline at end of file